@@ -1,61 +1,240 @@
 import time
 import os
-import threading
-from datetime import datetime, timedelta
+import sys
+import mmap
+import pickle
+import struct
+import bisect
+import atexit
+import locale
+import signal
+from collections import defaultdict
+from datetime import datetime
+
+_SNAPSHOT_VERSION = 2  # Bump whenever the attributes stored on Task change
+_PRIORITY_STR = ("Unknown", "High", "Medium", "Low")  # Indexed by priority
+_NO_DEADLINE = float('inf')  # Cached "no open deadline ahead", so idle redraws skip the scan
+_TEXT_ENCODING = 'utf-8'  # database.txt; files from before this was pinned used the locale encoding
+
+# Binary record: <I len><utf-8> for title, description, category, assigned_user, then <i deadline ordinal><i priority><B completed>
+_STR_LEN = struct.Struct('<I')
+_SCALARS = struct.Struct('<iiB')
 
 
 class Task:
+    __slots__ = ('title', 'description', 'category', 'priority', 'deadline', 'completed', 'assigned_user',
+                 'deadline_ts', '_title_key', '_category_key', '_row', '_widths')
+
     def __init__(self, title, description, category, priority, deadline, assigned_user):
         self.title = title
         self.description = description
         self.category = category
         self.priority = priority  # 1 - High, 2 - Medium, 3 - Low
         self.deadline = datetime.strptime(deadline, '%Y-%m-%d')
+        self.deadline_ts = int(self.deadline.timestamp())
         self.completed = False
         self.assigned_user = assigned_user
+        self._title_key = title.lower()
+        self._category_key = category.lower()
+        self._render_row()
 
     def mark_as_completed(self):
         self.completed = True
+        self._render_row()
+
+    def _render_row(self):
+        priority_str = _PRIORITY_STR[self.priority] if 1 <= self.priority <= 3 else "Unknown"
+        completed_str = "Yes" if self.completed else "No"
+        self._row = [str(self.title), str(self.description), str(self.category), priority_str, str(self.deadline.date()), str(self.assigned_user), completed_str]
+        self._widths = [len(cell) for cell in self._row]
 
-    def to_file_string(self):
-        return f"{self.title}|{self.description}|{self.category}|{self.priority}|{self.deadline.date()}|{self.assigned_user}|{self.completed}"
+    def to_file_bytes(self):
+        enc = _TEXT_ENCODING
+        return b'|'.join((self.title.encode(enc), self.description.encode(enc), self.category.encode(enc), str(self.priority).encode(enc),
+                          self._row[4].encode(enc), self.assigned_user.encode(enc), b'True' if self.completed else b'False')) + b'\n'
 
     @classmethod
-    def from_file_string(cls, line):
-        parts = line.split('|')
-        task = cls(parts[0], parts[1], parts[2], int(parts[3]), parts[4], parts[5])
-        if parts[6].lower() == 'true':
-            task.mark_as_completed()
+    def _fast_from_parts(cls, parts):
+        # Stored deadlines are always yyyy-mm-dd, so skip strptime and __init__
+        task = cls.__new__(cls)
+        task.title = parts[0]
+        task.description = parts[1]
+        task.category = parts[2]
+        task._title_key = task.title.lower()
+        task._category_key = task.category.lower()
+        task.priority = int(parts[3])
+        d = parts[4]
+        task.deadline = datetime(int(d[0:4]), int(d[5:7]), int(d[8:10]))
+        task.deadline_ts = int(task.deadline.timestamp())
+        task.assigned_user = parts[5]
+        task.completed = parts[6].strip().lower() == 'true'
+        task._render_row()
         return task
 
+    @classmethod
+    def from_file_string(cls, line):
+        return cls._fast_from_parts(line.split('|'))
+
+    @classmethod
+    def from_bytes(cls, line, encoding=_TEXT_ENCODING):
+        return cls._fast_from_parts([part.decode(encoding) for part in line.split(b'|')])
+
+    def to_record(self):
+        parts = []
+        for field in (self.title, self.description, self.category, self.assigned_user):
+            data = field.encode()
+            parts.append(_STR_LEN.pack(len(data)))
+            parts.append(data)
+        parts.append(_SCALARS.pack(self.deadline.toordinal(), self.priority, self.completed))
+        return b''.join(parts)
+
+    @classmethod
+    def from_record(cls, buf, offset):
+        fields = []
+        for _ in range(4):
+            (length,) = _STR_LEN.unpack_from(buf, offset)
+            offset += _STR_LEN.size
+            if offset + length > len(buf):
+                raise EOFError("truncated task record")
+            fields.append(buf[offset:offset + length].decode())
+            offset += length
+        ordinal, priority, completed = _SCALARS.unpack_from(buf, offset)
+        offset += _SCALARS.size
+        task = cls.__new__(cls)
+        task.title, task.description, task.category, task.assigned_user = fields
+        task._title_key = task.title.lower()
+        task._category_key = task.category.lower()
+        task.priority = priority
+        # The calendar date is stored, the timestamp is local to whoever loads it
+        task.deadline = datetime.fromordinal(ordinal)
+        task.deadline_ts = int(task.deadline.timestamp())
+        task.completed = bool(completed)
+        task._render_row()
+        return task, offset
+
     def to_row(self):
-        priority_str = {1: "High", 2: "Medium", 3: "Low"}.get(self.priority, "Unknown")
-        completed_str = "Yes" if self.completed else "No"
-        return [self.title, self.description, self.category, priority_str, str(self.deadline.date()), self.assigned_user, completed_str]
+        return self._row
 
 
 class TaskManager:
-    def __init__(self):
+    def __init__(self, use_text=False):
         self.tasks = []
-        self.file_path = "database.txt"
-        self.notification_active = True
-        self.upcoming_reminders = []  # Shared list for reminders
+        self.use_text = use_text  # Human-readable '|' format, mostly for debugging; the store is converted on switch
+        self.text_path = "database.txt"
+        self.binary_path = "database.bin"
+        self.file_path = self.text_path if use_text else self.binary_path
+        self.snapshot_path = "database.pkl"  # Fast-load copy of text_path
+        self._by_title = defaultdict(list)  # Tasks sharing a title, in insertion order
+        self._by_category = defaultdict(list)
+        self._by_priority = defaultdict(list)
+        self._deadlines = []  # Sorted deadline timestamps, parallel to _deadline_tasks
+        self._deadline_tasks = []
+        self._index_dirty = True  # Rebuilt on first lookup
+        self._col_max = [0] * 7  # Widest cell per table column
+        self._col_max_count = [0] * 7  # How many tasks have a cell of exactly that width
+        self._min_future_deadline = None  # Earliest open deadline still ahead; _NO_DEADLINE if none, None means recompute
+        self._pending = 0  # Mutations since file_path was last compacted
+        self._needs_rewrite = False  # A completion or delete is not on disk yet
+        self._flush_thresh = 64
+        self._fh = None
         self.load_tasks_from_file()
-        self.start_notification_thread()
+        self._recompute_col_max()
+        self._fh = open(self.file_path, 'ab')  # Append-only handle for new tasks
+        atexit.register(self.flush)
+
+    def _index_buckets(self, task):
+        self._by_title[task._title_key].append(task)
+        self._by_category[task._category_key].append(task)
+        self._by_priority[task.priority].append(task)
+
+    def _index_task(self, task):
+        self._index_buckets(task)
+        i = bisect.bisect_right(self._deadlines, task.deadline_ts)
+        self._deadlines.insert(i, task.deadline_ts)
+        self._deadline_tasks.insert(i, task)
+
+    def _unindex_task(self, task):
+        for index, key in ((self._by_title, task._title_key), (self._by_category, task._category_key),
+                           (self._by_priority, task.priority)):
+            bucket = index[key]
+            bucket.remove(task)
+            if not bucket:
+                del index[key]
+        i = bisect.bisect_left(self._deadlines, task.deadline_ts)
+        while self._deadline_tasks[i] is not task:
+            i += 1
+        del self._deadlines[i]
+        del self._deadline_tasks[i]
+
+    def _ensure_index(self):
+        if not self._index_dirty:
+            return
+        self._by_title.clear()
+        self._by_category.clear()
+        self._by_priority.clear()
+        for task in self.tasks:
+            self._index_buckets(task)
+        # One stable sort keeps equal deadlines in insertion order, like bisect_right does
+        self._deadline_tasks = sorted(self.tasks, key=lambda task: task.deadline_ts)
+        self._deadlines = [task.deadline_ts for task in self._deadline_tasks]
+        self._index_dirty = False
+
+    def _find_by_title(self, title):
+        self._ensure_index()
+        bucket = self._by_title.get(title.lower())
+        return bucket[0] if bucket else None
+
+    def _update_col_max(self, task):
+        for i, width in enumerate(task._widths):
+            if width > self._col_max[i]:
+                self._col_max[i] = width
+                self._col_max_count[i] = 1
+            elif width == self._col_max[i]:
+                self._col_max_count[i] += 1
+
+    def _release_col_max(self, task):
+        # Returns True when the task was the last one at some column's max width
+        stale = False
+        for i, width in enumerate(task._widths):
+            if width == self._col_max[i]:
+                self._col_max_count[i] -= 1
+                stale = stale or self._col_max_count[i] == 0
+        return stale
+
+    def _recompute_col_max(self):
+        self._col_max = [0] * 7
+        self._col_max_count = [0] * 7
+        for task in self.tasks:
+            self._update_col_max(task)
 
     def add_task(self, task):
+        # Encode first so a task that cannot be stored never reaches self.tasks
+        data = task.to_file_bytes() if self.use_text else task.to_record()
         self.tasks.append(task)
-        self.save_tasks_to_file()
-
-    def format_as_table(self, rows, headers):
-        col_widths = [max(len(str(row[i])) for row in rows + [headers]) for i in range(len(headers))]
-        table = []
+        self._update_col_max(task)
+        if not self._index_dirty:
+            self._index_task(task)
+        self._fh.write(data)
+        self._fh.flush()
+        if (self._min_future_deadline is not None and not task.completed
+                and time.time() < task.deadline_ts < self._min_future_deadline):
+            self._min_future_deadline = task.deadline_ts
+        self._pending += 1
+        self._maybe_flush()
+
+    def format_as_table(self, rows, headers, widths, out=None):
+        # rows may be any iterable; widths are the widest cell per column, so rows are consumed once
+        if out is None:
+            out = sys.stdout
+        col_widths = [max(widths[i], len(headers[i])) for i in range(len(headers))]
         header_line = " | ".join(f"{headers[i].ljust(col_widths[i])}" for i in range(len(headers)))
-        table.append(header_line)
-        table.append("-+-".join("-" * col_widths[i] for i in range(len(headers))))
-        for row in rows:
-            table.append(" | ".join(f"{str(row[i]).ljust(col_widths[i])}" for i in range(len(row))))
-        return "\n".join(table)
+        out.write(header_line + "\n")
+        out.write("-+-".join("-" * col_widths[i] for i in range(len(headers))) + "\n")
+        out.writelines(" | ".join(row[i].ljust(col_widths[i]) for i in range(len(row))) + "\n" for row in rows)
+
+    def _bucket_widths(self, bucket):
+        # Filtered tables are sized to their own rows, not to every task
+        return [max(column) for column in zip(*(task._widths for task in bucket))]
 
     def list_tasks(self):
         if not self.tasks:
@@ -63,92 +242,331 @@ class TaskManager:
             return
 
         headers = ["Title", "Description", "Category", "Priority", "Deadline", "Assigned To", "Completed"]
-        rows = [task.to_row() for task in self.tasks]
-        print(self.format_as_table(rows, headers))
+        rows = (task.to_row() for task in self.tasks)
+        self.format_as_table(rows, headers, self._col_max)
 
     def list_tasks_by_category(self, category):
         headers = ["Title", "Description", "Category", "Priority", "Deadline", "Assigned To", "Completed"]
-        rows = [task.to_row() for task in self.tasks if task.category.lower() == category.lower()]
-        if rows:
+        self._ensure_index()
+        bucket = self._by_category.get(category.lower())
+        if bucket:
+            rows = (task.to_row() for task in bucket)
             print(f"Tasks in category: {category}")
-            print(self.format_as_table(rows, headers))
+            self.format_as_table(rows, headers, self._bucket_widths(bucket))
         else:
             print(f"No tasks found in category: {category}")
 
     def list_tasks_by_priority(self, priority):
         headers = ["Title", "Description", "Category", "Priority", "Deadline", "Assigned To", "Completed"]
-        rows = [task.to_row() for task in self.tasks if task.priority == priority]
-        if rows:
-            priority_str = {1: "High", 2: "Medium", 3: "Low"}.get(priority, "Unknown")
+        self._ensure_index()
+        bucket = self._by_priority.get(priority)
+        if bucket:
+            rows = (task.to_row() for task in bucket)
+            priority_str = _PRIORITY_STR[priority] if 1 <= priority <= 3 else "Unknown"
             print(f"Tasks with priority: {priority_str}")
-            print(self.format_as_table(rows, headers))
+            self.format_as_table(rows, headers, self._bucket_widths(bucket))
         else:
             print(f"No tasks found with priority: {priority}")
 
     def mark_task_as_completed(self, title):
-        for task in self.tasks:
-            if task.title.lower() == title.lower():
-                task.mark_as_completed()
-                self.save_tasks_to_file()
-                print(f"Task marked as completed: {task.title}")
-                return
+        task = self._find_by_title(title)
+        if task:
+            stale = self._release_col_max(task)
+            task.mark_as_completed()
+            if stale:
+                self._recompute_col_max()
+            else:
+                self._update_col_max(task)
+            if task.deadline_ts == self._min_future_deadline:
+                self._min_future_deadline = None
+            self._pending += 1
+            self._needs_rewrite = True
+            self._maybe_flush()
+            print(f"Task marked as completed: {task.title}")
+            return
         print(f"Task not found: {title}")
 
     def delete_task(self, title):
-        to_remove = None
-        for task in self.tasks:
-            if task.title.lower() == title.lower():
-                to_remove = task
-                break
+        to_remove = self._find_by_title(title)
         if to_remove:
             self.tasks.remove(to_remove)
-            self.save_tasks_to_file()
+            self._unindex_task(to_remove)
+            if self._release_col_max(to_remove):
+                self._recompute_col_max()
+            if to_remove.deadline_ts == self._min_future_deadline:
+                self._min_future_deadline = None
+            self._pending += 1
+            self._needs_rewrite = True
+            self._maybe_flush()
             print(f"Task deleted: {title}")
         else:
             print(f"Task not found: {title}")
 
+    def _snapshot_is_fresh(self):
+        # add_task only appends to file_path, so an older snapshot is missing tasks
+        return (os.path.exists(self.snapshot_path)
+                and os.stat(self.snapshot_path).st_mtime_ns > os.stat(self.text_path).st_mtime_ns)
+
+    def _save_snapshot(self):
+        self._replace_file(self.snapshot_path, pickle.dumps((_SNAPSHOT_VERSION, self.tasks), protocol=pickle.HIGHEST_PROTOCOL))
+
     def load_tasks_from_file(self):
+        if not self.use_text:
+            if os.path.exists(self.file_path):
+                self._load_tasks_from_binary()
+            elif os.path.exists(self.text_path):
+                self._migrate_from_text()
+            return
+        if os.path.exists(self.binary_path):
+            self._migrate_from_binary()
+            return
         if not os.path.exists(self.file_path):
             return
-        with open(self.file_path, 'r') as file:
-            for line in file:
+        if self._snapshot_is_fresh():
+            try:
+                with open(self.snapshot_path, 'rb') as file:
+                    version, tasks = pickle.load(file)
+                if version == _SNAPSHOT_VERSION:
+                    self.tasks.extend(tasks)
+                    return
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError):
+                pass  # Corrupt or outdated snapshot, rebuild from the text file
+        self._load_tasks_from_text()
+        self._save_snapshot()
+
+    def _migrate_from_text(self):
+        # Import from database.txt (older versions or a --text session); the old files are moved aside
+        self._load_tasks_from_text()
+        self.save_tasks_to_file()
+        os.replace(self.text_path, self.text_path + '.migrated')
+        if os.path.exists(self.snapshot_path):
+            os.remove(self.snapshot_path)
+
+    def _migrate_from_binary(self):
+        # --text works on the same tasks: convert the store and move the binary file aside
+        self._load_tasks_from_binary()
+        self.save_tasks_to_file()
+        os.replace(self.binary_path, self.binary_path + '.migrated')
+
+    def _load_tasks_from_binary(self):
+        with open(self.binary_path, 'rb') as file:
+            try:
+                mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):  # Empty file or mmap unsupported
+                data = file.read()
+            else:
+                with mm:
+                    end, good = len(mm), self._parse_records(mm)
+                data = None
+        if data is not None:
+            end, good = len(data), self._parse_records(data)
+        if good < end:
+            # Drop a record left half-written by a crash so later appends stay reachable,
+            # keeping the cut bytes in case the "partial" record was really corruption
+            with open(self.binary_path, 'rb') as file:
+                file.seek(good)
+                tail = file.read()
+            with open(self.binary_path + '.partial', 'wb') as file:
+                file.write(tail)
+            os.truncate(self.binary_path, good)
+
+    def _parse_records(self, buf):
+        # Returns the offset just past the last complete record
+        offset = 0
+        end = len(buf)
+        while offset < end:
+            try:
+                task, offset = Task.from_record(buf, offset)
+            except (struct.error, EOFError):
+                break  # The record runs past the end of the file
+            except (ValueError, OverflowError, OSError) as e:
+                raise RuntimeError(f"{self.binary_path} is corrupt at byte {offset} ({e}); "
+                                   f"the file was left untouched") from e
+            self.tasks.append(task)
+        return offset
+
+    def _load_tasks_from_text(self):
+        try:
+            self._read_text(_TEXT_ENCODING)
+        except UnicodeDecodeError:
+            self.tasks.clear()
+            self._read_text(locale.getpreferredencoding(False))
+            # Re-encode now, or the UTF-8 lines add_task appends would be misread on the next load
+            self._replace_file(self.text_path, b''.join(task.to_file_bytes() for task in self.tasks))
+
+    def _read_text(self, encoding):
+        with open(self.text_path, 'rb') as file:
+            try:
+                mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):  # Empty file or mmap unsupported
+                mm = None
+            if mm is not None:
+                with mm:
+                    for line in iter(mm.readline, b''):
+                        if line.strip():
+                            self.tasks.append(Task.from_bytes(line.strip(), encoding))
+                return
+        with open(self.text_path, 'r', encoding=encoding) as file:
+            lines = file.read().splitlines()
+        for line in lines:
+            if line.strip():
                 self.tasks.append(Task.from_file_string(line.strip()))
 
+    def _replace_file(self, path, data):
+        # Write next to the target and swap it in, so a failed save never truncates it
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+        reopen = path == self.file_path and self._fh is not None and not self._fh.closed
+        if reopen:
+            self._fh.close()  # The append handle must follow the new file (and Windows cannot replace an open one)
+        os.replace(tmp_path, path)
+        if reopen:
+            self._fh = open(self.file_path, 'ab')
+
     def save_tasks_to_file(self):
-        with open(self.file_path, 'w') as file:
-            for task in self.tasks:
-                file.write(task.to_file_string() + '\n')
+        if not self.use_text:
+            self._replace_file(self.file_path, b''.join(task.to_record() for task in self.tasks))
+            return
+        buf = bytearray()
+        for task in self.tasks:
+            buf.extend(task.to_file_bytes())
+        self._replace_file(self.file_path, buf)
+        self._save_snapshot()
+
+    def compute_upcoming_reminders(self):
+        now_ts = time.time()
+        if self._min_future_deadline is None or self._min_future_deadline <= now_ts:
+            self._min_future_deadline = self._next_open_deadline(now_ts)
+        if self._min_future_deadline >= now_ts + 86400:
+            return []
+        self._ensure_index()
+        lo = bisect.bisect_right(self._deadlines, now_ts)
+        hi = bisect.bisect_left(self._deadlines, now_ts + 86400)
+        return [f"Task '{task.title}' has a deadline within 24 hours!"
+                for task in self._deadline_tasks[lo:hi] if not task.completed]
+
+    def _next_open_deadline(self, now_ts):
+        self._ensure_index()
+        for i in range(bisect.bisect_right(self._deadlines, now_ts), len(self._deadlines)):
+            if not self._deadline_tasks[i].completed:
+                return self._deadlines[i]
+        return _NO_DEADLINE
+
+    def _maybe_flush(self):
+        if self._pending >= self._flush_thresh:
+            self.flush()
+
+    def flush(self):
+        # Adds are already on disk; only completions and deletes need a rewrite
+        if self._needs_rewrite:
+            self.save_tasks_to_file()
+            self._needs_rewrite = False
+        self._pending = 0
+
+    def close(self):
+        atexit.unregister(self.flush)
+        self.flush()
+        self._fh.close()
+
+
+def _enable_ansi():
+    # Windows 10+ consoles understand ANSI escapes once VT processing is enabled
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        return False
+
+
+_ANSI_CLEAR = sys.stdout.isatty() and _enable_ansi()
+
+
+def clear_screen():
+    if _ANSI_CLEAR:
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
 
-    def start_notification_thread(self):
-        threading.Thread(target=self.notification_thread, daemon=True).start()
 
-    def notification_thread(self):
-        while self.notification_active:
-            self.check_upcoming_deadlines()
-            time.sleep(60)  # Check every minute
+def install_exit_handlers(task_manager):
+    # atexit only runs on a normal exit; turn termination signals into one so pending writes are flushed
+    def on_signal(signum, frame):
+        raise SystemExit(128 + signum)
 
-    def check_upcoming_deadlines(self):
-        now = datetime.now()
-        self.upcoming_reminders.clear()
+    for name in ('SIGTERM', 'SIGHUP', 'SIGBREAK'):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), on_signal)
+    if os.name == 'nt':
+        _install_console_close_handler(task_manager)
+
+
+_console_handler = None  # Keeps the ctypes callback alive
+
+
+def _install_console_close_handler(task_manager):
+    # Closing the console window, logoff and shutdown kill the process without raising a signal
+    global _console_handler
+    try:
+        import ctypes
+        from ctypes import wintypes
+        handler_type = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.DWORD)
+
+        def on_console_event(event):
+            if event in (2, 5, 6):  # CTRL_CLOSE_EVENT, CTRL_LOGOFF_EVENT, CTRL_SHUTDOWN_EVENT
+                task_manager.flush()
+            return False
+
+        _console_handler = handler_type(on_console_event)
+        ctypes.windll.kernel32.SetConsoleCtrlHandler(_console_handler, True)
+    except (AttributeError, OSError):
+        pass
 
-        for task in self.tasks:
-            if not task.completed and task.deadline > now and task.deadline < now + timedelta(days=1):
-                self.upcoming_reminders.append(f"Task '{task.title}' has a deadline within 24 hours!")
 
-    def stop_notifications(self):
-        self.notification_active = False
+def read_fields(prompt_labels):
+    sys.stdout.write('; '.join(prompt_labels) + ' (separate with |):\n')
+    sys.stdout.flush()
+    return [field.strip() for field in sys.stdin.readline().rstrip('\n').split('|')]
+
+
+def parse_priority(text):
+    try:
+        priority = int(text)
+    except ValueError:
+        print("Invalid priority. Please enter a number between 1 and 3.")
+        return None
+    if not 1 <= priority <= 3:
+        print("Invalid priority. Please enter a number between 1 and 3.")
+        return None
+    return priority
+
+
+_ADD_TASK_LABELS = ["Title", "Description", "Category", "Priority (1-High, 2-Medium, 3-Low)", "Deadline (yyyy-mm-dd)", "Assigned to"]
 
 
 def main():
-    task_manager = TaskManager()
+    try:
+        task_manager = TaskManager(use_text='--text' in sys.argv[1:])
+    except RuntimeError as e:
+        print(e)
+        return
+    install_exit_handlers(task_manager)
 
     while True:
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
 
-        
-        if task_manager.upcoming_reminders:
+        reminders = task_manager.compute_upcoming_reminders()
+        if reminders:
             print("\n--- To-Do ---")
-            print("\n".join(task_manager.upcoming_reminders))
+            print("\n".join(reminders))
             print("\n")
 
         print("--- Task Management System ---")
@@ -167,16 +585,24 @@ def main():
             continue
 
         if choice == 1:
-            title = input("Enter task title: ")
-            description = input("Enter description: ")
-            category = input("Enter category: ")
-            try:
-                priority = int(input("Enter priority (1-High, 2-Medium, 3-Low): "))
-            except ValueError:
-                print("Invalid priority. Please enter a number between 1 and 3.")
-                continue
-            deadline = input("Enter deadline (yyyy-mm-dd): ")
-            assigned_user = input("Assign to user: ")
+            if sys.stdin.isatty():
+                title = input("Enter task title: ")
+                description = input("Enter description: ")
+                category = input("Enter category: ")
+                priority = parse_priority(input("Enter priority (1-High, 2-Medium, 3-Low): "))
+                if priority is None:
+                    continue
+                deadline = input("Enter deadline (yyyy-mm-dd): ")
+                assigned_user = input("Assign to user: ")
+            else:
+                fields = read_fields(_ADD_TASK_LABELS)
+                if len(fields) != len(_ADD_TASK_LABELS):
+                    print(f"Expected {len(_ADD_TASK_LABELS)} fields separated by |.")
+                    continue
+                title, description, category, priority, deadline, assigned_user = fields
+                priority = parse_priority(priority)
+                if priority is None:
+                    continue
 
             try:
                 task = Task(title, description, category, priority, deadline, assigned_user)
@@ -186,18 +612,18 @@ def main():
                 print("Invalid date format. Please use yyyy-mm-dd.")
 
         elif choice == 2:
-            os.system('cls' if os.name == 'nt' else 'clear')
+            clear_screen()
             task_manager.list_tasks()
             input("\n\nPress Enter to continue...")
 
         elif choice == 3:
-            os.system('cls' if os.name == 'nt' else 'clear')
+            clear_screen()
             filter_category = input("Enter category: ")
             task_manager.list_tasks_by_category(filter_category)
             input("\n\nPress Enter to continue...")
 
         elif choice == 4:
-            os.system('cls' if os.name == 'nt' else 'clear')
+            clear_screen()
             try:
                 filter_priority = int(input("Enter priority (1-High, 2-Medium, 3-Low): "))
                 task_manager.list_tasks_by_priority(filter_priority)
@@ -206,20 +632,20 @@ def main():
             input("\n\nPress Enter to continue...")
 
         elif choice == 5:
-            os.system('cls' if os.name == 'nt' else 'clear')
+            clear_screen()
             completed_task_title = input("Enter task title to mark as completed: ")
             task_manager.mark_task_as_completed(completed_task_title)
             input("\n\nPress Enter to continue...")
 
         elif choice == 6:
-            os.system('cls' if os.name == 'nt' else 'clear')
+            clear_screen()
             delete_task_title = input("Enter task title to delete: ")
             task_manager.delete_task(delete_task_title)
             input("\n\nPress Enter to continue...")
 
         elif choice == 7:
             print(".........")
-            task_manager.stop_notifications()  # Stop the notification thread
+            task_manager.close()
             break
 
         else:
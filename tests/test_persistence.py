@@ -0,0 +1,228 @@
+import os
+import signal
+import subprocess
+import struct
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ACP FINAL"))
+
+import System  # noqa: E402
+from System import Task, TaskManager  # noqa: E402
+
+
+def make_task(title, priority=1, deadline="2030-01-15", category="Work"):
+    return Task(title, f"{title} description", category, priority, deadline, "bob")
+
+
+class PersistenceTestCase(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self._managers = []
+
+    def tearDown(self):
+        for manager in self._managers:
+            if not manager._fh.closed:
+                manager.close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def open_manager(self, use_text=False):
+        manager = TaskManager(use_text=use_text)
+        self._managers.append(manager)
+        return manager
+
+    def assertTasks(self, manager, expected):
+        self.assertEqual([(t.title, t.priority, str(t.deadline.date()), t.completed) for t in manager.tasks], expected)
+
+
+class BinaryFormatTests(PersistenceTestCase):
+    def test_round_trip_after_close(self):
+        manager = self.open_manager()
+        manager.add_task(make_task("A", 1, "2030-01-15"))
+        manager.add_task(make_task("B", 2, "2031-06-30"))
+        manager.add_task(make_task("Ü", 3, "1960-02-29"))
+        manager.mark_task_as_completed("b")
+        manager.delete_task("a")
+        manager.close()
+
+        reloaded = self.open_manager()
+        self.assertTasks(reloaded, [("B", 2, "2031-06-30", True), ("Ü", 3, "1960-02-29", False)])
+
+    def test_adds_are_on_disk_without_close(self):
+        manager = self.open_manager()
+        manager.add_task(make_task("A"))
+
+        reloaded = self.open_manager()
+        self.assertTasks(reloaded, [("A", 1, "2030-01-15", False)])
+
+    @unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset")
+    def test_deadline_date_does_not_depend_on_timezone(self):
+        old_tz = os.environ.get("TZ")
+        try:
+            os.environ["TZ"] = "Asia/Manila"
+            time.tzset()
+            manager = self.open_manager()
+            manager.add_task(make_task("A", deadline="2030-01-15"))
+            manager.close()
+
+            os.environ["TZ"] = "America/Los_Angeles"
+            time.tzset()
+            reloaded = self.open_manager()
+            self.assertTasks(reloaded, [("A", 1, "2030-01-15", False)])
+            self.assertEqual(reloaded.tasks[0].deadline_ts, int(reloaded.tasks[0].deadline.timestamp()))
+        finally:
+            if old_tz is None:
+                os.environ.pop("TZ", None)
+            else:
+                os.environ["TZ"] = old_tz
+            time.tzset()
+
+    def test_truncated_trailing_record_is_dropped(self):
+        manager = self.open_manager()
+        manager.add_task(make_task("A"))
+        manager.close()
+        good_size = os.path.getsize("database.bin")
+        with open("database.bin", "ab") as file:
+            file.write(make_task("B").to_record()[:-3])
+
+        reloaded = self.open_manager()
+        self.assertTasks(reloaded, [("A", 1, "2030-01-15", False)])
+        self.assertEqual(os.path.getsize("database.bin"), good_size)
+        self.assertTrue(os.path.exists("database.bin.partial"))
+
+        reloaded.add_task(make_task("C"))
+        reloaded.close()
+        self.assertTasks(self.open_manager(), [("A", 1, "2030-01-15", False), ("C", 1, "2030-01-15", False)])
+
+    def test_corrupt_record_mid_file_is_not_truncated(self):
+        manager = self.open_manager()
+        for title in ("A", "B", "C"):
+            manager.add_task(make_task(title))
+        manager.close()
+        with open("database.bin", "rb") as file:
+            data = bytearray(file.read())
+        first = len(make_task("A").to_record())
+        data[first + 4] = 0xff  # First byte of B's title, no longer valid UTF-8
+        with open("database.bin", "wb") as file:
+            file.write(data)
+
+        with self.assertRaises(RuntimeError):
+            TaskManager()
+        with open("database.bin", "rb") as file:
+            self.assertEqual(file.read(), bytes(data))
+
+    def test_unpackable_task_does_not_wipe_file(self):
+        manager = self.open_manager()
+        manager.add_task(make_task("A"))
+        manager.add_task(make_task("B"))
+        manager.delete_task("a")  # Leaves a rewrite pending
+        with self.assertRaises(struct.error):
+            manager.add_task(make_task("C", priority=2 ** 31))
+        self.assertEqual([t.title for t in manager.tasks], ["B"])
+        manager.close()
+
+        self.assertTasks(self.open_manager(), [("B", 1, "2030-01-15", False)])
+
+
+class ExitTests(PersistenceTestCase):
+    @unittest.skipUnless(hasattr(signal, "SIGTERM") and os.name != "nt", "needs POSIX signals")
+    def test_sigterm_flushes_pending_deletes(self):
+        manager = self.open_manager()
+        manager.add_task(make_task("A"))
+        manager.add_task(make_task("B"))
+        manager.close()
+
+        script = os.path.join(os.path.dirname(System.__file__), "System.py")
+        proc = subprocess.Popen([sys.executable, script], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        proc.stdin.write(b"6\nA\n")
+        proc.stdin.flush()
+        deadline = time.time() + 10
+        output = b""
+        while b"Task deleted" not in output and time.time() < deadline:
+            output += proc.stdout.read1(4096)
+        proc.send_signal(signal.SIGTERM)
+        proc.communicate(timeout=10)
+
+        self.assertIn(b"Task deleted", output)
+        self.assertEqual([t.title for t in self.open_manager().tasks], ["B"])
+
+
+class TextFormatTests(PersistenceTestCase):
+    def test_round_trip_after_close(self):
+        manager = self.open_manager(use_text=True)
+        manager.add_task(make_task("A"))
+        manager.add_task(make_task("Café", 2))
+        manager.mark_task_as_completed("café")
+        manager.close()
+
+        reloaded = self.open_manager(use_text=True)
+        self.assertTasks(reloaded, [("A", 1, "2030-01-15", False), ("Café", 2, "2030-01-15", True)])
+
+    def test_legacy_locale_file_is_rewritten_as_utf8(self):
+        with open("database.txt", "wb") as file:
+            file.write("Über|x|Work|1|2030-01-15|bob|False\n".encode("cp1252"))
+        with mock.patch("locale.getpreferredencoding", return_value="cp1252"):
+            manager = self.open_manager(use_text=True)
+        self.assertEqual([t.title for t in manager.tasks], ["Über"])
+        manager.add_task(make_task("Ärger"))
+        manager.close()
+
+        reloaded = self.open_manager(use_text=True)
+        self.assertEqual([t.title for t in reloaded.tasks], ["Über", "Ärger"])
+        with open("database.txt", "rb") as file:
+            file.read().decode("utf-8")
+
+    def test_stale_snapshot_is_not_used(self):
+        manager = self.open_manager(use_text=True)
+        manager.add_task(make_task("A"))
+        manager.mark_task_as_completed("a")
+        manager.close()  # Full save writes database.pkl
+        self.assertTrue(os.path.exists("database.pkl"))
+
+        manager = self.open_manager(use_text=True)
+        manager.add_task(make_task("B"))  # Appended to database.txt only
+        manager.close()
+
+        reloaded = self.open_manager(use_text=True)
+        self.assertEqual([t.title for t in reloaded.tasks], ["A", "B"])
+
+    def test_switching_formats_keeps_the_same_tasks(self):
+        manager = self.open_manager()
+        manager.add_task(make_task("A"))
+        manager.close()
+
+        text = self.open_manager(use_text=True)
+        self.assertTasks(text, [("A", 1, "2030-01-15", False)])
+        self.assertFalse(os.path.exists("database.bin"))
+        text.add_task(make_task("B"))
+        text.mark_task_as_completed("a")
+        text.close()
+
+        self.assertTasks(self.open_manager(), [("A", 1, "2030-01-15", True), ("B", 1, "2030-01-15", False)])
+        self.assertFalse(os.path.exists("database.txt"))
+
+
+class MigrationTests(PersistenceTestCase):
+    def test_text_file_is_imported_once(self):
+        with open("database.txt", "w", encoding="utf-8") as file:
+            file.write("A|a description|Work|1|2030-01-15|bob|True\n")
+            file.write("B|b description|Home|3|2031-06-30|al|False\n")
+
+        manager = self.open_manager()
+        self.assertTasks(manager, [("A", 1, "2030-01-15", True), ("B", 3, "2031-06-30", False)])
+        self.assertTrue(os.path.exists("database.bin"))
+        self.assertFalse(os.path.exists("database.txt"))
+        self.assertTrue(os.path.exists("database.txt.migrated"))
+        manager.close()
+
+        self.assertTasks(self.open_manager(), [("A", 1, "2030-01-15", True), ("B", 3, "2031-06-30", False)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ACP FINAL"))
+
+import System  # noqa: E402
+from System import Task, TaskManager  # noqa: E402
+
+
+def days_from_today(days):
+    return (date.today() + timedelta(days=days)).isoformat()
+
+
+class ReminderTests(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.manager = TaskManager()
+        self.scans = 0
+        next_open_deadline = self.manager._next_open_deadline
+
+        def counting(now_ts):
+            self.scans += 1
+            return next_open_deadline(now_ts)
+
+        self.manager._next_open_deadline = counting
+
+    def tearDown(self):
+        self.manager.close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def add(self, title, days):
+        self.manager.add_task(Task(title, "", "Work", 1, days_from_today(days), "bob"))
+
+    def test_only_open_tasks_due_within_a_day_are_reported(self):
+        self.add("Tomorrow", 1)
+        self.add("Done", 1)
+        self.add("Later", 5)
+        self.add("Yesterday", -1)
+        self.manager.mark_task_as_completed("done")
+
+        self.assertEqual(self.manager.compute_upcoming_reminders(),
+                         ["Task 'Tomorrow' has a deadline within 24 hours!"])
+
+    def test_no_open_deadline_is_cached(self):
+        for i in range(5):
+            self.add(f"T{i}", 1)
+            self.manager.mark_task_as_completed(f"t{i}")
+
+        for _ in range(10):
+            self.assertEqual(self.manager.compute_upcoming_reminders(), [])
+        self.assertEqual(self.scans, 1)
+        self.assertEqual(self.manager._min_future_deadline, System._NO_DEADLINE)
+
+    def test_far_deadline_skips_the_scan(self):
+        self.add("Later", 5)
+        for _ in range(10):
+            self.assertEqual(self.manager.compute_upcoming_reminders(), [])
+        self.assertEqual(self.scans, 1)
+
+    def test_cache_follows_adds_completions_and_deletes(self):
+        self.add("Later", 5)
+        self.assertEqual(self.manager.compute_upcoming_reminders(), [])
+
+        self.add("Tomorrow", 1)
+        self.assertEqual(self.manager.compute_upcoming_reminders(),
+                         ["Task 'Tomorrow' has a deadline within 24 hours!"])
+
+        self.manager.mark_task_as_completed("tomorrow")
+        self.assertEqual(self.manager.compute_upcoming_reminders(), [])
+
+        self.add("Soon", 1)
+        self.manager.delete_task("soon")
+        self.assertEqual(self.manager.compute_upcoming_reminders(), [])
+        self.assertEqual(self.scans, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ACP FINAL"))
+
+from System import Task, TaskManager  # noqa: E402
+
+
+class ColumnWidthTests(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.manager = TaskManager()
+        self.recomputes = 0
+        recompute = self.manager._recompute_col_max
+
+        def counting():
+            self.recomputes += 1
+            recompute()
+
+        self.manager._recompute_col_max = counting
+
+    def tearDown(self):
+        self.manager.close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def add(self, title, description="d"):
+        self.manager.add_task(Task(title, description, "Work", 1, "2030-01-15", "bob"))
+
+    def assertWidthsMatchTasks(self):
+        expected = [max(column) for column in zip(*(task._widths for task in self.manager.tasks))]
+        self.assertEqual(self.manager._col_max, expected)
+
+    def test_deleting_narrow_tasks_does_not_recompute(self):
+        self.add("Widest title", "the widest description")
+        for i in range(5):
+            self.add(f"T{i}")
+        for i in range(5):
+            self.manager.delete_task(f"t{i}")
+        self.assertEqual(self.recomputes, 0)
+        self.assertWidthsMatchTasks()
+
+    def test_deleting_the_widest_task_recomputes(self):
+        self.add("Widest title", "the widest description")
+        self.add("T")
+        self.manager.delete_task("widest title")
+        self.assertEqual(self.recomputes, 1)
+        self.assertWidthsMatchTasks()
+
+    def test_shared_max_width_survives_one_delete(self):
+        self.add("Same", "same")
+        self.add("Also", "same")
+        self.manager.delete_task("same")
+        self.assertEqual(self.recomputes, 0)
+        self.assertWidthsMatchTasks()
+
+    def test_completing_tasks_keeps_widths_exact(self):
+        self.add("A")
+        self.add("B")
+        self.manager.mark_task_as_completed("a")
+        self.manager.mark_task_as_completed("b")
+        self.assertWidthsMatchTasks()
+        self.assertEqual(self.manager._col_max_count[6], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()